@@ -110,11 +110,15 @@ def write_exploration_log(
         filename (str): Output CSV filename.
         exploration_log (list): Exploration log entries.
     """
+    rows = [
+        (step, x, y, actions)
+        for step, (x, y, actions) in enumerate(exploration_log, start=1)
+    ]
+
     with open(filename, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["Step", "x-coordinate", "y-coordinate", "Actions"])
-        for step, (x, y, actions) in enumerate(exploration_log, start=1):
-            writer.writerow([step, x, y, actions])
+        writer.writerows(rows)
 
 
 def write_statistics(
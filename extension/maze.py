@@ -1,5 +1,97 @@
+import heapq
 from typing import Tuple, List, Optional
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+# Orientation characters and their indices (0=N, 1=E, 2=S, 3=W).
+_ORIENT_CH = "NESW"
+_ORIENT_IDX = {"N": 0, "E": 1, "S": 2, "W": 3}
+
+# Forward step per orientation index.
+_DX = (0, 1, 0, -1)
+_DY = (1, 0, -1, 0)
+
+# (left, front, right) wall indices per orientation index.
+_SIDES = ((3, 0, 1), (0, 1, 2), (1, 2, 3), (2, 3, 0))
+
+
+def _bfs_bidir_csr(rptr, col, start, target, n):
+    """
+    Bidirectional BFS over a CSR adjacency of n flattened cells.
+
+    Two frontiers grow from start and target, always expanding the
+    smaller one a full layer at a time, and the search stops on the
+    first cell reached from both sides. Returns (parent_s, parent_t,
+    meet) where meet is that cell, or -1 if the target is unreachable;
+    the caller splices the two parent chains into the final path. The
+    body is a pure integer/numpy loop so it compiles as a Numba kernel
+    when numba is installed, and still runs unmodified under the plain
+    interpreter when it is not.
+    """
+    visited_s = np.zeros(n, dtype=np.bool_)
+    visited_t = np.zeros(n, dtype=np.bool_)
+    visited_s[start] = True
+    visited_t[target] = True
+
+    parent_s = np.full(n, -1, dtype=np.int32)
+    parent_t = np.full(n, -1, dtype=np.int32)
+
+    if start == target:
+        return parent_s, parent_t, start
+
+    # BFS pops in insertion order and never from the back, so each
+    # queue is a fixed int32 array with head/tail cursors: at most n
+    # cells are ever enqueued, so no resize can occur.
+    queue_s = np.empty(n, dtype=np.int32)
+    queue_t = np.empty(n, dtype=np.int32)
+    queue_s[0] = start
+    queue_t[0] = target
+    head_s = 0
+    tail_s = 1
+    head_t = 0
+    tail_t = 1
+
+    while head_s < tail_s and head_t < tail_t:
+        if tail_s - head_s <= tail_t - head_t:
+            layer_end = tail_s
+            while head_s < layer_end:
+                current = queue_s[head_s]
+                head_s += 1
+                for i in range(rptr[current], rptr[current + 1]):
+                    neighbour = col[i]
+                    if not visited_s[neighbour]:
+                        visited_s[neighbour] = True
+                        parent_s[neighbour] = current
+                        if visited_t[neighbour]:
+                            return parent_s, parent_t, neighbour
+                        queue_s[tail_s] = neighbour
+                        tail_s += 1
+        else:
+            layer_end = tail_t
+            while head_t < layer_end:
+                current = queue_t[head_t]
+                head_t += 1
+                for i in range(rptr[current], rptr[current + 1]):
+                    neighbour = col[i]
+                    if not visited_t[neighbour]:
+                        visited_t[neighbour] = True
+                        parent_t[neighbour] = current
+                        if visited_s[neighbour]:
+                            return parent_s, parent_t, neighbour
+                        queue_t[tail_t] = neighbour
+                        tail_t += 1
+
+    return parent_s, parent_t, -1
+
+
+if njit is not None:
+    _bfs_bidir_csr = njit(cache=True)(_bfs_bidir_csr)
+
 
 class Maze:
     """
@@ -16,8 +108,20 @@ class Maze:
         self._width = width
         self._height = height
 
-        self._horizontal_walls = set()
-        self._vertical_walls = set()
+        # Wall bitboards indexed by (cell, wall line). Border lines are
+        # filled in once so get_walls never needs boundary comparisons.
+        self._hwalls = np.zeros((width, height + 1), dtype=bool)
+        self._vwalls = np.zeros((height, width + 1), dtype=bool)
+        self._hwalls[:, 0] = True
+        self._hwalls[:, height] = True
+        self._vwalls[:, 0] = True
+        self._vwalls[:, width] = True
+
+        # Lazily built per-cell wall caches and CSR adjacency.
+        self._walls_cache: Optional[np.ndarray] = None
+        self._cell_walls: Optional[np.ndarray] = None
+        self._rptr: Optional[np.ndarray] = None
+        self._col: Optional[np.ndarray] = None
 
     @property
     def width(self) -> int:
@@ -33,13 +137,83 @@ class Maze:
         """
         Add an internal horizontal wall to the maze.
         """
-        self._horizontal_walls.add((x_cordinates, horizontal_line))
+        self._hwalls[x_cordinates, horizontal_line] = True
+        self._walls_cache = None
+        self._cell_walls = None
+        self._rptr = None
 
     def add_vertical_wall(self, y_cordiates: int, vertical_line: int):
         """
         Add an internal vertical wall to the maze.
         """
-        self._vertical_walls.add((y_cordiates, vertical_line))
+        self._vwalls[y_cordiates, vertical_line] = True
+        self._walls_cache = None
+        self._cell_walls = None
+        self._rptr = None
+
+    def add_horizontal_walls(self, mask: np.ndarray):
+        """
+        Add internal horizontal walls in bulk from a bool mask.
+
+        Args:
+            mask: Bool array of shape (width, height - 1); a True at
+                (x, line - 1) adds the wall at (x, line).
+        """
+        self._hwalls[:, 1:self._height] |= mask
+        self._walls_cache = None
+        self._cell_walls = None
+        self._rptr = None
+
+    def add_vertical_walls(self, mask: np.ndarray):
+        """
+        Add internal vertical walls in bulk from a bool mask.
+
+        Args:
+            mask: Bool array of shape (height, width - 1); a True at
+                (y, line - 1) adds the wall at (y, line).
+        """
+        self._vwalls[:, 1:self._width] |= mask
+        self._walls_cache = None
+        self._cell_walls = None
+        self._rptr = None
+
+    def _ensure_walls_cache(self):
+        """
+        Build the per-cell wall cache for the current walls if needed.
+
+        The cache holds all four walls of every cell in (N, E, S, W)
+        order, assembled from the bitboards in four vector copies, and
+        is invalidated whenever walls are added. Walls are immutable
+        between mutations, so repeated queries for the same cell (as in
+        explore, which revisits cells while backtracking) become a
+        single array read.
+        """
+        if self._walls_cache is not None:
+            return
+
+        cache = np.empty((self._width, self._height, 4), dtype=bool)
+        cache[:, :, 0] = self._hwalls[:, 1:]
+        cache[:, :, 1] = self._vwalls[:, 1:].T
+        cache[:, :, 2] = self._hwalls[:, :-1]
+        cache[:, :, 3] = self._vwalls[:, :-1].T
+        self._walls_cache = cache
+
+    def _ensure_cell_walls(self):
+        """
+        Build the packed per-cell wall bytes if not cached.
+
+        Each cell folds its four walls into one uint8 (N=bit 0, E=bit 1,
+        S=bit 2, W=bit 3), so a neighbour check reads a single byte and
+        tests bits, and the whole maze fits in cache at a byte per cell.
+        """
+        if self._cell_walls is not None:
+            return
+
+        self._ensure_walls_cache()
+        bits = np.array([1, 2, 4, 8], dtype=np.uint8)
+        self._cell_walls = (self._walls_cache * bits).sum(
+            axis=2, dtype=np.uint8
+        )
 
     def get_walls(
         self, x_cordinate: int, y_cordinate: int
@@ -49,26 +223,10 @@ class Maze:
 
         Returns wall presence in the order (north, east, south, west).
         """
-        x = x_cordinate
-        y = y_cordinate
-
-        north = y == self._height - 1
-        south = y == 0
-        west = x == 0
-        east = x == self._width - 1
-
-        # Internal horizontal walls
-        if (x, y + 1) in self._horizontal_walls:
-            north = True
-        if (x, y) in self._horizontal_walls:
-            south = True
-
-        # Internal vertical walls
-        if (y, x + 1) in self._vertical_walls:
-            east = True
-        if (y, x) in self._vertical_walls:
-            west = True
+        if self._walls_cache is None:
+            self._ensure_walls_cache()
 
+        north, east, south, west = self._walls_cache[x_cordinate, y_cordinate]
         return north, east, south, west
 
     def sense_walls(self, runner):
@@ -83,14 +241,7 @@ class Maze:
 
         walls = self.get_walls(x, y)
 
-        side_map = {
-            "N": (3, 0, 1),
-            "E": (0, 1, 2),
-            "S": (1, 2, 3),
-            "W": (2, 3, 0),
-        }
-
-        left_i, front_i, right_i = side_map[orient]
+        left_i, front_i, right_i = _SIDES[_ORIENT_IDX[orient]]
         return walls[left_i], walls[front_i], walls[right_i]
 
     def go_straight(self, runner):
@@ -121,13 +272,12 @@ class Maze:
         """
         Turn the runner left or right without changing its position.
         """
-        orientations = ["N", "E", "S", "W"]
-        idx = orientations.index(runner["orientation"])
+        idx = _ORIENT_IDX[runner["orientation"]]
 
         if direction == "Left":
-            new_orientation = orientations[(idx - 1) % 4]
+            new_orientation = _ORIENT_CH[(idx - 1) & 3]
         elif direction == "Right":
-            new_orientation = orientations[(idx + 1) % 4]
+            new_orientation = _ORIENT_CH[(idx + 1) & 3]
         else:
             raise ValueError("Direction must be left or right")
 
@@ -137,54 +287,92 @@ class Maze:
             "orientation": new_orientation,
         }
 
-    def move(self, runner):
-        """
-        Move the runner using a left-hand rule strategy.
+    def _step(self, x: int, y: int, orient: int) -> Tuple[int, int]:
         """
-        left_wall, front_wall, right_wall = self.sense_walls(runner)
+        Advance one cell along an orientation index without sensing.
 
-        if not left_wall:
-            turned = self._turn(runner, "Left")
-            return self.go_straight(turned), "LF"
-
-        if not front_wall:
-            return self.go_straight(runner), "F"
+        The caller must already have checked that the move is legal;
+        the public go_straight keeps its own safety check.
+        """
+        return x + _DX[orient], y + _DY[orient]
 
-        if not right_wall:
-            turned = self._turn(runner, "Right")
-            return self.go_straight(turned), "RF"
+    def move(self, runner):
+        """
+        Move the runner using a left-hand rule strategy.
 
+        Walls are sensed once, then the step is taken directly rather
+        than re-sensing through _turn and go_straight, and the runner
+        dict is updated in place and returned, so stepping allocates no
+        new dict.
+        """
         x = runner["x"]
         y = runner["y"]
-        orient = runner["orientation"]
-        opposite = {"N": "S", "S": "N", "E": "W", "W": "E"}[orient]
+        orient = _ORIENT_IDX[runner["orientation"]]
 
-        if orient == "N":
-            y -= 1
-        elif orient == "S":
-            y += 1
-        elif orient == "E":
-            x -= 1
-        elif orient == "W":
-            x += 1
+        walls = self.get_walls(x, y)
+
+        if not walls[(orient + 3) & 3]:
+            orient = (orient + 3) & 3
+            actions = "LF"
+        elif not walls[orient]:
+            actions = "F"
+        elif not walls[(orient + 1) & 3]:
+            orient = (orient + 1) & 3
+            actions = "RF"
+        else:
+            orient = (orient + 2) & 3
+            actions = "B"
 
-        return {"x": x, "y": y, "orientation": opposite}, "B"
+        x, y = self._step(x, y, orient)
+        runner["x"] = x
+        runner["y"] = y
+        runner["orientation"] = _ORIENT_CH[orient]
+        return runner, actions
 
     def explore(self, runner, goal=None):
         """
         Explore the maze until the goal is reached.
 
-        Uses local movement decisions rather than global planning.
+        Uses local movement decisions rather than global planning. The
+        left-hand rule runs over three local ints (x, y and an
+        orientation index), so no runner dicts are allocated per step.
         """
         if goal is None:
             goal = (self.width - 1, self.height - 1)
 
+        x = runner["x"]
+        y = runner["y"]
+        orient = _ORIENT_IDX[runner["orientation"]]
+
+        goal_x, goal_y = goal
+
         log = []
 
-        while (runner["x"], runner["y"]) != goal:
-            new_runner, actions = self.move(runner)
-            log.append((runner["x"], runner["y"], actions))
-            runner = new_runner
+        # Bind lookups once outside the loop; explore runs thousands of
+        # steps and each self./global lookup would repeat per step.
+        get_walls = self.get_walls
+        log_append = log.append
+        dx = _DX
+        dy = _DY
+
+        while x != goal_x or y != goal_y:
+            walls = get_walls(x, y)
+
+            if not walls[(orient + 3) & 3]:
+                orient = (orient + 3) & 3
+                actions = "LF"
+            elif not walls[orient]:
+                actions = "F"
+            elif not walls[(orient + 1) & 3]:
+                orient = (orient + 1) & 3
+                actions = "RF"
+            else:
+                orient = (orient + 2) & 3
+                actions = "B"
+
+            log_append((x, y, actions))
+            x += dx[orient]
+            y += dy[orient]
 
         return log
 
@@ -192,25 +380,119 @@ class Maze:
         """
         Return neighbouring cells that can be reached without crossing walls.
         """
-        neighbours: List[Tuple[int, int]] = []
+        self._ensure_cell_walls()
+        walls = int(self._cell_walls[x, y])
 
-        north, east, south, west = self.get_walls(x, y)
+        neighbours: List[Tuple[int, int]] = []
+        append = neighbours.append
 
-        if not north:
-            neighbours.append((x, y + 1))
-        if not east:
-            neighbours.append((x + 1, y))
-        if not south:
-            neighbours.append((x, y - 1))
-        if not west:
-            neighbours.append((x - 1, y))
+        if not walls & 1:
+            append((x, y + 1))
+        if not walls & 2:
+            append((x + 1, y))
+        if not walls & 4:
+            append((x, y - 1))
+        if not walls & 8:
+            append((x - 1, y))
 
         return neighbours
 
+    def _ensure_csr(self):
+        """
+        Build the CSR adjacency for the current walls if not cached.
+
+        Cells are flattened as ``v = y * width + x``; the neighbours of
+        cell ``v`` are ``self._col[self._rptr[v]:self._rptr[v + 1]]``.
+        The arrays are invalidated whenever a wall is added.
+        """
+        if self._rptr is not None:
+            return
+
+        self._ensure_cell_walls()
+        cell_walls = self._cell_walls
+
+        width = self._width
+        n = width * self._height
+
+        rptr = np.empty(n + 1, dtype=np.int32)
+        col = np.empty(4 * n, dtype=np.int32)
+
+        count = 0
+        rptr[0] = 0
+        for v in range(n):
+            y, x = divmod(v, width)
+            walls = cell_walls[x, y]
+            if not walls & 1:
+                col[count] = v + width
+                count += 1
+            if not walls & 2:
+                col[count] = v + 1
+                count += 1
+            if not walls & 4:
+                col[count] = v - width
+                count += 1
+            if not walls & 8:
+                col[count] = v - 1
+                count += 1
+            rptr[v + 1] = count
+
+        self._rptr = rptr
+        self._col = col
+
     def shortest_path(
         self,
         starting: Optional[Tuple[int, int]] = None,
         goal: Optional[Tuple[int, int]] = None,
+    ) -> List[Tuple[int, int]]:
+        """
+        Compute the shortest path using bidirectional BFS.
+
+        On a uniform-cost grid BFS finds the same optimal path as A*
+        without any heap overhead, so it is the default here;
+        shortest_path_astar remains available for a heuristic-guided
+        search or as a basis for non-uniform edge costs.
+        """
+        start = starting if starting is not None else (0, 0)
+        target = goal if goal is not None else (self.width - 1, self.height - 1)
+
+        self._ensure_csr()
+
+        width = self._width
+        n = width * self._height
+        start_v = start[1] * width + start[0]
+        target_v = target[1] * width + target[0]
+
+        parent_s, parent_t, meet = _bfs_bidir_csr(
+            self._rptr, self._col, start_v, target_v, n
+        )
+
+        if meet == -1:
+            return []
+
+        # Splice the two parent chains at the meeting cell: walk back
+        # to the start, then forward from the meeting cell to the goal.
+        path: List[Tuple[int, int]] = []
+        node = int(meet)
+        while node != start_v:
+            y, x = divmod(node, width)
+            path.append((x, y))
+            node = int(parent_s[node])
+        path.append(start)
+
+        path.reverse()
+
+        node = int(parent_t[int(meet)])
+        while node != -1:
+            y, x = divmod(node, width)
+            path.append((x, y))
+            node = int(parent_t[node])
+
+        return path
+
+    def shortest_path_astar(
+        self,
+        starting: Optional[Tuple[int, int]] = None,
+        goal: Optional[Tuple[int, int]] = None,
     ) -> List[Tuple[int, int]]:
         """
         Compute the shortest path using the A* search algorithm.
@@ -222,50 +504,73 @@ class Maze:
         start = starting if starting is not None else (0, 0)
         target = goal if goal is not None else (self.width - 1, self.height - 1)
 
-        # Manhattan distance heuristic (admissible for grid movement)
-        def h(a: tuple[int, int], b: tuple[int, int]) -> int:
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        self._ensure_csr()
+        rptr = self._rptr
+        col = self._col
+
+        width = self._width
+        n = width * self._height
+        start_v = start[1] * width + start[0]
+        target_v = target[1] * width + target[0]
+        target_x, target_y = target
 
-        import heapq
+        # Priority queue storing f_cost * n + node as a single int:
+        # since node < n the ordering matches (f_cost, node) tuples
+        # exactly, including tie-breaks, without allocating any tuples.
+        open_set: list[int] = []
+        heapq.heappush(open_set, start_v)
 
-        # Priority queue storing (f_cost, node)
-        open_set: list[tuple[int, tuple[int, int]]] = []
-        heapq.heappush(open_set, (0, start))
+        # Capacity-sized arrays replace the g-cost/parent dicts and the
+        # expanded set: every container is allocated at the cell count
+        # up front, so nothing rehashes or resizes mid-search. A g-cost
+        # of -1 marks an undiscovered cell.
+        g_cost = np.full(n, -1, dtype=np.int32)
+        g_cost[start_v] = 0
 
-        # Cost from start to each node
-        g_cost: dict[tuple[int, int], int] = {start: 0}
+        parent = np.full(n, -1, dtype=np.int32)
 
-        # Parent map used to reconstruct the final path
-        parent: dict[tuple[int, int], tuple[int, int]] = {}
+        # Nodes already expanded; a node can sit in the heap several
+        # times, so stale entries are skipped when popped rather than
+        # re-expanded.
+        expanded = np.zeros(n, dtype=bool)
+
+        # Bound methods avoid an attribute lookup per heap operation.
+        heappush = heapq.heappush
+        heappop = heapq.heappop
 
         # Main A* search loop
         while open_set:
-            _, current = heapq.heappop(open_set)
+            current = heappop(open_set) % n
 
-            if current == target:
+            if current == target_v:
                 break
 
-            cx, cy = current
-            for nx, ny in self._get_neighbours(cx, cy):
-                neighbour = (nx, ny)
-                tentative_g = g_cost[current] + 1
+            if expanded[current]:
+                continue
+            expanded[current] = True
+
+            for neighbour in col[rptr[current]:rptr[current + 1]]:
+                tentative_g = int(g_cost[current]) + 1
 
-                if neighbour not in g_cost or tentative_g < g_cost[neighbour]:
+                if g_cost[neighbour] == -1 or tentative_g < g_cost[neighbour]:
                     g_cost[neighbour] = tentative_g
                     parent[neighbour] = current
-                    f_cost = tentative_g + h(neighbour, target)
-                    heapq.heappush(open_set, (f_cost, neighbour))
+                    # Manhattan heuristic (admissible for grid movement)
+                    ny, nx = divmod(int(neighbour), width)
+                    f_cost = tentative_g + abs(nx - target_x) + abs(ny - target_y)
+                    heappush(open_set, f_cost * n + ny * width + nx)
 
-        if target not in g_cost:
+        if g_cost[target_v] == -1:
             return []
 
         # Reconstruct path from goal back to start
         path: list[tuple[int, int]] = []
-        node = target
+        node = target_v
 
-        while node != start:
-            path.append(node)
-            node = parent[node]
+        while node != start_v:
+            y, x = divmod(int(node), width)
+            path.append((x, y))
+            node = int(parent[node])
 
         path.append(start)
         path.reverse()
@@ -12,6 +12,8 @@ import sys
 import csv
 from typing import Tuple, List
 
+import numpy as np
+
 from maze import Maze
 from runner import create_runner
 
@@ -62,18 +64,17 @@ def maze_reader(maze_file: str) -> Maze:
 
     maze = Maze(maze_width, maze_height)
 
-    for y in range(maze_height):
-        for x in range(maze_width):
-            ascii_x = 2 * x + 1
-            ascii_y = 2 * (maze_height - 1 - y) + 1
+    # Interior wall characters sit on alternating rows and columns of
+    # the ASCII grid; ASCII rows run top-down while maze rows run
+    # bottom-up, hence the [::-1] flips.
+    data = np.frombuffer("".join(rows).encode(), dtype="S1")
+    data = data.reshape(ascii_height, ascii_width)
 
-            if x < maze_width - 1:
-                if rows[ascii_y][ascii_x + 1] == "#":
-                    maze.add_vertical_wall(y, x + 1)
+    hwall_mask = data[2:-1:2, 1::2] == b"#"
+    maze.add_horizontal_walls(hwall_mask[::-1].T)
 
-            if y < maze_height - 1:
-                if rows[ascii_y - 1][ascii_x] == "#":
-                    maze.add_horizontal_wall(x, y + 1)
+    vwall_mask = data[1::2, 2:-1:2] == b"#"
+    maze.add_vertical_walls(vwall_mask[::-1])
 
     return maze
 
@@ -110,11 +111,15 @@ def write_exploration_log(
         filename (str): Output CSV filename.
         exploration_log (list): Exploration log entries.
     """
+    rows = [
+        (step, x, y, actions)
+        for step, (x, y, actions) in enumerate(exploration_log, start=1)
+    ]
+
     with open(filename, "w", newline="") as f:
         writer = csv.writer(f)
         writer.writerow(["Step", "x-coordinate", "y-coordinate", "Actions"])
-        for step, (x, y, actions) in enumerate(exploration_log, start=1):
-            writer.writerow([step, x, y, actions])
+        writer.writerows(rows)
 
 
 def write_statistics(
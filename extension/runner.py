@@ -1,3 +1,8 @@
+# Orientation characters and their indices (0=N, 1=E, 2=S, 3=W).
+_ORIENT_CH = "NESW"
+_ORIENT_IDX = {"N": 0, "E": 1, "S": 2, "W": 3}
+
+
 def create_runner(x: int = 0, y: int = 0, orientation: str = "N"):
     """
     Create and returns a runner represented as a dict,
@@ -32,15 +37,13 @@ def turn(runner, direction: str):
     Turns the runner left or right.
     The position stays the same, only orientation changes.
     """
-    orientations = ["N", "E", "S", "W"]
-
     current = runner["orientation"]
-    idx = orientations.index(current)
+    idx = _ORIENT_IDX[current]
 
     if direction == "Left":
-        new_orientation = orientations[(idx - 1) % 4]
+        new_orientation = _ORIENT_CH[(idx - 1) & 3]
     elif direction == "Right":
-        new_orientation = orientations[(idx + 1) % 4]
+        new_orientation = _ORIENT_CH[(idx + 1) & 3]
     else:
         new_orientation = current
 